@@ -8,6 +8,9 @@ from PySide6.QtWidgets import QDialog, QTextEdit, QPushButton, QVBoxLayout, QLab
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+# Application log attached to bug reports
+LOG_PATH = os.path.join(os.path.dirname(__file__), "data/application.log")
+
 # Class to manage dialog state
 class DialogState:
     """Class to manage the state of dialogs in the application."""
@@ -60,10 +63,9 @@ class BugReportDialog(QDialog):
         """Send the bug report to Sentry with additional context."""
         # Get the description and log content
         desc = self.description.toPlainText()
-        log_path = os.path.join(os.path.dirname(__file__), "data/application.log")
         # Read the last 1000 lines of the log file
         try:
-            with open(log_path, 'r') as log_file:
+            with open(LOG_PATH, 'r') as log_file:
                 log_content = ''.join(log_file.readlines()[-1000:])  # Last 1000 lines
         except FileNotFoundError:
             log_content = "Log file not found."
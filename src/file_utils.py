@@ -0,0 +1,21 @@
+import os
+
+def get_file_key(path):
+    """
+    Return a key identifying the current version of a file, for invalidating caches of its contents.
+
+    The key combines the inode, size and modification time. Modification times are coarse,
+    but replacing a file (as os.replace does) always gives it a new inode, so a rewrite
+    within one timestamp tick still changes the key.
+
+    Args:
+        path (str): The file to identify.
+
+    Returns:
+        tuple: The (st_ino, st_size, st_mtime_ns) of the file.
+
+    Raises:
+        OSError: If the file can't be stat'ed, e.g. FileNotFoundError when it doesn't exist.
+    """
+    stat = os.stat(path)
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
@@ -0,0 +1,43 @@
+import json
+
+# Prefer orjson for its faster parsing and serialization, falling back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches errors from either backend
+JSONDecodeError = json.JSONDecodeError
+
+def loads(data):
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data (bytes or str): The JSON document.
+
+    Returns:
+        Any: The deserialized Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj, indent=False, sort_keys=False):
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj (Any): The object to serialize.
+        indent (bool): Whether to pretty-print the output with an indent of two spaces.
+        sort_keys (bool): Whether to sort dictionary keys, giving an order-independent output.
+
+    Returns:
+        bytes: The serialized JSON document.
+    """
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    # Match orjson's output byte for byte, so fingerprints don't change with the installed backend
+    separators = (",", ": ") if indent else (",", ":")
+    return json.dumps(obj, indent=2 if indent else None, separators=separators, sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
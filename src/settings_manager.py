@@ -9,11 +9,12 @@ from typing import Any, Dict, Optional
 logger = logging.getLogger(__name__)
 
 # Configurable paths with environment variable support
+BASE_DIR = os.path.dirname(__file__)
 CONFIG_PATH = os.environ.get(
     'HOTKEY_HELPER_CONFIG_PATH',
-    os.path.join(os.path.dirname(__file__), "data/config.json")
+    os.path.join(BASE_DIR, "data/config.json")
 )
-BACKUP_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "data/config_backup.json")
+BACKUP_CONFIG_PATH = os.path.join(BASE_DIR, "data/config_backup.json")
 
 class SettingsManager:
 
@@ -171,6 +172,18 @@ class SettingsManager:
         """
         return self.settings.get(key, default or self.default_settings.get(key))
 
+    def get_settings(self, *keys: str) -> Dict[str, Any]:
+        """
+        Retrieve several settings in a single call.
+
+        Args:
+            *keys (str): Setting keys to retrieve
+
+        Returns:
+            Dict[str, Any]: Mapping of each key to its setting value or default
+        """
+        return {key: self.settings.get(key, self.default_settings.get(key)) for key in keys}
+
     def set_setting(self, key: str, value: Any) -> bool:
         """
         Set a specific setting with validation.
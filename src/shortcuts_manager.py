@@ -1,11 +1,11 @@
 import subprocess
-import time
 import psutil
 import platform
 import difflib
-import json
 import logging
 import re
+import json_backend
+import file_utils
 
 from threading import Lock
 
@@ -25,29 +25,39 @@ class ShortcutManager:
     """Manages application shortcuts with caching and optimized matching."""
 
 
-    def __init__(self, map_path, db_path, cache_duration=1):
+    def __init__(self, map_path, db_path):
         """
         Initialize the ShortcutManager with paths and cache settings.
 
+        Caches are reloaded only when the file_utils key of their file changes.
+
         Args:
             map_path (str): Path to the application mapping text file.
             db_path (str): Path to the local shortcut JSON database.
-            cache_duration (int): Cache duration in seconds (default: 60).
         """
         self.map_path = map_path
         self.db_path = db_path
-        self.cache_duration = cache_duration
         self.app_map_cache = None
         self.app_names_sorted = None
+        self.app_map_key = None
         self.shortcut_cache = None
-        self.last_load_time = 0
+        self.shortcut_db_key = None
         self.cache_lock = Lock()
 
+    @staticmethod
+    def get_file_key(path):
+        """Return the file_utils key of a file, or None if it can't be read."""
+        try:
+            return file_utils.get_file_key(path)
+        except OSError:
+            return None
+
     def load_app_map(self):
         """Load and cache the application map from the text file."""
-        current_time = time.time()
-        # Reload the app map if cache is empty or expired
-        if self.app_map_cache is None or (current_time - self.last_load_time) > self.cache_duration:
+        # Reload the app map if cache is empty or the file has changed
+        file_key = self.get_file_key(self.map_path)
+        if self.app_map_cache is None or file_key != self.app_map_key:
+            self.app_map_key = file_key
             try:
                 with open(self.map_path, "r") as file:
                     app_map = {}
@@ -60,7 +70,6 @@ class ShortcutManager:
                                 app_map[app_name] = {"name": app_name, "version": version}
                     self.app_map_cache = app_map
                     self.app_names_sorted = sorted(app_map.keys(), key=len, reverse=True)
-                    self.last_load_time = time.time()
                     logger.info("App map loaded and cached")
 
             except FileNotFoundError:
@@ -75,18 +84,19 @@ class ShortcutManager:
 
     def load_shortcut_cache(self):
         """Load and cache the shortcut database from the JSON file."""
-        # Reload the shortcut cache if empty or expired
+        # Reload the shortcut cache if empty or the database file has changed
         with self.cache_lock:
-            if self.shortcut_cache is None or (time.time() - self.last_load_time) > self.cache_duration:
+            file_key = self.get_file_key(self.db_path)
+            if self.shortcut_cache is None or file_key != self.shortcut_db_key:
+                self.shortcut_db_key = file_key
                 try:
-                    with open(self.db_path, "r") as f:
-                        self.shortcut_cache = json.load(f)
-                    self.last_load_time = time.time()
+                    with open(self.db_path, "rb") as f:
+                        self.shortcut_cache = json_backend.loads(f.read())
                     logger.info("Shortcut database loaded and cached")
                 except FileNotFoundError:
                     logger.error("Shortcut database file not found: %s", self.db_path)
                     self.shortcut_cache = {}
-                except json.JSONDecodeError:
+                except json_backend.JSONDecodeError:
                     logger.error("Error decoding JSON from shortcut database")
                     self.shortcut_cache = {}
                 except Exception as e:
@@ -142,11 +152,12 @@ class ShortcutManager:
         # If no app name is found, return empty dict
         if app_name:
             self.load_shortcut_cache()  # Ensure the cache is loaded
-            logger.info("Available apps in shortcut_cache: %s", list(self.shortcut_cache.keys()))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available apps in shortcut_cache: %s", list(self.shortcut_cache.keys()))
 
             # First try exact match
             if app_name in self.shortcut_cache:
-                logger.info("Exact match found for: '%s'", app_name)
+                logger.debug("Exact match found for: '%s'", app_name)
                 shortcuts = self.shortcut_cache[app_name]
                 return shortcuts
 
@@ -169,7 +180,7 @@ class ShortcutManager:
                 try:
                     matched_app = next(app for app, norm in normalized_apps.items() if norm == matched_normalized)
                     similarity = difflib.SequenceMatcher(None, normalized_input, matched_normalized).ratio()
-                    logger.info("Strict fuzzy matched '%s' to '%s' with similarity %.2f", app_name, matched_app, similarity)
+                    logger.debug("Strict fuzzy matched '%s' to '%s' with similarity %.2f", app_name, matched_app, similarity)
                     shortcuts = self.shortcut_cache[matched_app]
                     return shortcuts
                 except StopIteration:
@@ -193,12 +204,12 @@ class ShortcutManager:
 
             # If a partial match is found, use it
             if best_match:
-                logger.info("Partial match found: '%s' matched to '%s' with score %.2f", app_name, best_match, best_score)
+                logger.debug("Partial match found: '%s' matched to '%s' with score %.2f", app_name, best_match, best_score)
                 shortcuts = self.shortcut_cache[best_match]
                 return shortcuts
 
             # If no match is found, return empty dict
-            logger.info("No exact or close matches for: '%s' in the cache", app_name)
+            logger.debug("No exact or close matches for: '%s' in the cache", app_name)
             return {}
 
 def normalize_app_name(name):
@@ -24,8 +24,43 @@ from shortcuts_manager import (
 logger = logging.getLogger(__name__)
 
 # Constants for file paths
-APP_NAME_MAP_PATH = os.path.join(os.path.dirname(__file__), "data/app_name_map.txt")
-LOCAL_DB_PATH = os.path.join(os.path.dirname(__file__), "data/local_shortcut_db.json")
+BASE_DIR = os.path.dirname(__file__)
+APP_NAME_MAP_PATH = os.path.join(BASE_DIR, "data/app_name_map.txt")
+LOCAL_DB_PATH = os.path.join(BASE_DIR, "data/local_shortcut_db.json")
+SEARCH_ICON_PATH = os.path.join(BASE_DIR, "data/search.png")
+
+# Predefined themes with corresponding styles for the shortcut display
+THEMES = {
+    'dark': {
+        'background': '#444444',
+        'font_color': '#ffffff',
+        'search_bar': {
+            'background': '#333333',
+            'border': '1px solid #444444',
+            'focus_border': '1px solid #1E88E5'
+        }
+    },
+    'light': {
+        'background': '#f0f0f0',
+        'font_color': '#000000',
+        'search_bar': {
+            'background': '#FFFFFF',
+            'border': '1px solid #DADADA',
+            'focus_border': '1px solid #4CAF50'
+        }
+    }
+}
+THEME_FONT_COLORS = frozenset(properties['font_color'] for properties in THEMES.values())
+
+# Current operating system and its icon file, relative to the application directory
+CURRENT_OS = platform.system()
+ICON_RELATIVE_PATH = {
+    "Windows": "data/icon.ico",
+    "Darwin": "data/icon.icns",
+}.get(CURRENT_OS, "data/icon.png")
+
+# Minimum number of shortcuts for an application before searches use a trigram index
+TRIGRAM_INDEX_THRESHOLD = 200
 
 class TrayIcon(QSystemTrayIcon):
 
@@ -51,7 +86,7 @@ class TrayIcon(QSystemTrayIcon):
 
     def __init__(self, settings_manager=None, is_action_in_progress=False, parent=None):
         super().__init__(parent)
-        self.base_dir = os.path.dirname(__file__)
+        self.base_dir = BASE_DIR
         self.settings_manager = settings_manager or {}
         self.is_action_in_progress = is_action_in_progress
         self.init_ui()
@@ -67,18 +102,12 @@ class TrayIcon(QSystemTrayIcon):
 
         Parameters:
         - base_dir (str): Base directory containing icon files.
+
+        Returns:
+        - str: Path to the icon for the current operating system.
         """
-        # Determine the icon path based on the operating system
-        self.icon_path_win = os.path.join(base_dir, "data/icon.ico")
-        self.icon_path_mac = os.path.join(base_dir, "data/icon.icns")
-        self.icon_path_linux = os.path.join(base_dir, "data/icon.png")
-
-        # Set the icon path based on the current OS
-        self.icon_path = (
-            self.icon_path_win if platform.system() == "Windows"
-            else self.icon_path_mac if platform.system() == "Darwin"
-            else self.icon_path_linux
-        )
+        self.icon_path = os.path.join(base_dir, ICON_RELATIVE_PATH)
+        return self.icon_path
 
     def setup_tray_icon(self):
         """Configures the system tray icon and context menu actions."""
@@ -138,6 +167,9 @@ class ShortcutDisplay(QWidget):
     - local_db_path (str): Path to the local shortcut database.
     """
 
+    # Composed stylesheets shared across instances, keyed by style settings
+    _STYLESHEET_CACHE = {}
+
     # Signals for shortcut display actions
     def __init__(self, settings_manager, map_path=APP_NAME_MAP_PATH, local_db_path=LOCAL_DB_PATH, interval=250, parent=None):
         super().__init__(parent)
@@ -146,11 +178,16 @@ class ShortcutDisplay(QWidget):
         self.interval = interval
         self.timer = QTimer()
         self.text = ""
-        self.current_os = platform.system()
+        self.current_os = CURRENT_OS
         self.is_search_active = False
         self.last_active_app_name = None
         self.current_shortcuts = {}
-        self.SEARCH_ICON_PATH = os.path.join(os.path.dirname(__file__), "data/search.png")
+        self._indexed_shortcuts = None
+        self._search_texts = {}
+        self._key_order = {}
+        self._trigram_index = {}
+        self._current_style_key = None
+        self.SEARCH_ICON_PATH = SEARCH_ICON_PATH
         self.SCREEN_SIZE_WIDTH = self.settings_manager.get_setting('max_window_width')
         self.SCREEN_SIZE_HEIGHT = self.settings_manager.get_setting('max_window_height')
         self.adapt = self.settings_manager.get_setting('adapting_window_to_list')
@@ -206,7 +243,7 @@ class ShortcutDisplay(QWidget):
 
         # Match the active window title to an application name
         app_name = self.shortcut_manager.find_best_match(window_title)
-        print(app_name)
+        logger.debug("Matched application: %s", app_name)
         if not app_name:
             return
 
@@ -224,11 +261,7 @@ class ShortcutDisplay(QWidget):
 
         # Handle active search state and filter shortcuts
         if self.is_search_active:
-            filtered_shortcuts = {
-                key: value for key, value in self.current_shortcuts.items()
-                if self.text.lower() in key.lower() or
-                self.text.lower() in value.get("fields", {}).get("Description", "").lower()
-            }
+            filtered_shortcuts = self.filter_shortcuts(self.current_shortcuts, self.text)
 
             # Update the display with filtered shortcuts
             self.display_shortcuts(filtered_shortcuts)
@@ -245,59 +278,123 @@ class ShortcutDisplay(QWidget):
         # Adjust the window's size and position
         self.adjust_size_and_position()
 
+    def build_search_index(self, os_shortcuts):
+        """
+        Prepares the searchable text of each shortcut and, for large applications,
+        a trigram index mapping every 3-character sequence to the shortcuts containing it.
+
+        Parameters:
+        - os_shortcuts (dict): Shortcuts of the current OS, keyed by shortcut.
+        """
+        self._indexed_shortcuts = os_shortcuts
+        self._search_texts = {
+            key: f"{key}\n{data.get('Description', '')}".lower()
+            for key, data in os_shortcuts.items()
+        }
+        self._key_order = {key: index for index, key in enumerate(os_shortcuts)}
+        self._trigram_index = {}
+
+        # Small applications are scanned linearly, so skip the index entirely
+        if len(os_shortcuts) <= TRIGRAM_INDEX_THRESHOLD:
+            return
+
+        for key, text in self._search_texts.items():
+            for i in range(len(text) - 2):
+                self._trigram_index.setdefault(text[i:i + 3], set()).add(key)
+
+    def filter_shortcuts(self, shortcuts, text):
+        """
+        Filters the shortcuts of the current OS by a search query matching
+        either the shortcut keys or their description.
+
+        Parameters:
+        - shortcuts (dict): Shortcuts of the active application, keyed by OS.
+        - text (str): Search query.
+
+        Returns:
+        - dict: Matching shortcuts keyed by OS, or an empty dict if none match.
+        """
+        os_shortcuts = shortcuts.get(self.current_os, {}) if shortcuts else {}
+
+        # Rebuild the search index only when the shortcut set changes
+        if os_shortcuts is not self._indexed_shortcuts:
+            self.build_search_index(os_shortcuts)
+
+        needle = text.lower()
+        candidates = self._search_texts.keys()
+
+        # Narrow the candidates down to shortcuts containing every trigram of the query
+        if self._trigram_index and len(needle) >= 3:
+            trigram_sets = [self._trigram_index.get(needle[i:i + 3], set()) for i in range(len(needle) - 2)]
+            candidates = sorted(set.intersection(*trigram_sets), key=self._key_order.get)
+
+        filtered = {
+            key: os_shortcuts[key] for key in candidates
+            if needle in self._search_texts[key]
+        }
+        return {self.current_os: filtered} if filtered else {}
+
     def apply_styles_from_settings(self):
         """
         Applies styles to UI elements such as the main window and search bar
         based on user-defined or default settings.
         """
+        settings = self.settings_manager.get_settings('theme', 'font_family', 'font_color', 'font_size', 'opacity')
+
+        # Set window opacity
+        self.setWindowOpacity(settings['opacity'])
+
+        # Skip re-applying identical styles, since setStyleSheet re-polishes the widget tree
+        style_key = (settings['theme'], settings['font_family'], settings['font_size'], settings['font_color'])
+        if style_key == self._current_style_key:
+            return
+
+        # Compose the stylesheets once per combination of settings
+        stylesheets = self._STYLESHEET_CACHE.get(style_key)
+        if stylesheets is None:
+            stylesheets = self.compose_stylesheets(*style_key)
+            self._STYLESHEET_CACHE[style_key] = stylesheets
+
+        # Apply styles to the main window and specifically to the search bar
+        window_stylesheet, search_bar_stylesheet = stylesheets
+        self.setStyleSheet(window_stylesheet)
+        self.search_bar.setStyleSheet(search_bar_stylesheet)
+        self._current_style_key = style_key
+
+    @staticmethod
+    def compose_stylesheets(theme, font_family, font_size, font_color):
+        """
+        Composes the stylesheets for the main window and the search bar.
+
+        Parameters:
+        - theme (str): Name of the selected theme.
+        - font_family (str): Font family of the displayed text.
+        - font_size (int): Font size in pixels.
+        - font_color (str): Font color as a hex string.
+
+        Returns:
+        - tuple: Stylesheets for the main window and the search bar.
+        """
         padding = 3
-        theme = self.settings_manager.get_setting('theme')
-        font_family = self.settings_manager.get_setting('font_family')
-        font_color = self.settings_manager.get_setting('font_color')
-        font_size = self.settings_manager.get_setting('font_size')
-        opacity = self.settings_manager.get_setting('opacity')
-
-        # Predefined themes with corresponding styles
-        themes = {
-            'dark': {
-                'background': '#444444',
-                'font_color': '#ffffff',
-                'search_bar': {
-                    'background': '#333333',
-                    'border': '1px solid #444444',
-                    'focus_border': '1px solid #1E88E5'
-                }
-            },
-            'light': {
-                'background': '#f0f0f0',
-                'font_color': '#000000',
-                'search_bar': {
-                    'background': '#FFFFFF',
-                    'border': '1px solid #DADADA',
-                    'focus_border': '1px solid #4CAF50'
-                }
-            }
-        }
 
         # Default to light theme if an unrecognized theme is selected
-        theme_properties = themes.get(theme, themes['light'])
+        theme_properties = THEMES.get(theme, THEMES['light'])
 
         # Override font color only if it matches the theme's default
-        if font_color in {themes['dark']['font_color'], themes['light']['font_color']}:
+        if font_color in THEME_FONT_COLORS:
             font_color = theme_properties['font_color']
 
-        # Apply styles to the main window
-        stylesheet = f"""
+        # Styles for the main window
+        window_stylesheet = f"""
             padding: {padding}px;
             font-family: {font_family};
             font-size: {font_size}px;
             color: {font_color};
             background-color: {theme_properties['background']};
         """
-        self.setStyleSheet(stylesheet)
 
-        # Apply styles specifically to the search bar
-        search_bar_styles = f"""
+        # Styles specifically for the search bar
+        search_bar_stylesheet = f"""
             QLineEdit {{
                 background-color: {theme_properties['search_bar']['background']};
                 border: {theme_properties['search_bar']['border']};
@@ -312,10 +409,7 @@ class ShortcutDisplay(QWidget):
                 outline: none;
             }}
         """
-        self.search_bar.setStyleSheet(search_bar_styles)
-
-        # Set window opacity
-        self.setWindowOpacity(opacity)
+        return window_stylesheet, search_bar_stylesheet
 
     def setup_search_bar(self):
         """
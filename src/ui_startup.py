@@ -1,7 +1,8 @@
 import os
 import logging
+import threading
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QObject, QCoreApplication
 from PySide6.QtGui import Qt, QPixmap
 from PySide6.QtWidgets import QDialog, QLabel, QVBoxLayout, QHBoxLayout, QPushButton
 from update_manager import load_latest_version, check_for_application_updates
@@ -9,6 +10,45 @@ from update_manager import load_latest_version, check_for_application_updates
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+# Icon shown in the dialog header
+ICON_PATH = os.path.join(os.path.dirname(__file__), "data/icon.png")
+
+class UpdateCheckWorker(QObject):
+
+    """Checks for application updates on a daemon thread and reports the result through a signal."""
+
+    # Signals
+    result = Signal(bool)
+
+    def __init__(self, current_version, parent=None):
+        """
+        Initialize the UpdateCheckWorker.
+
+        Parameters:
+        current_version (str): The current version of the application.
+        parent (QObject): The owner of the worker, if any.
+        """
+        super().__init__(parent)
+        self.current_version = current_version
+
+    def start(self):
+        """
+        Start the update check in a daemon thread.
+
+        The request is bounded by its own timeout and the thread never blocks shutdown,
+        so nothing has to wait for or stop it when the application quits.
+        """
+        threading.Thread(target=self.run, name="update-check", daemon=True).start()
+
+    def run(self):
+        """Run the update check and emit its result, queued to the thread that owns the worker."""
+        update_available = check_for_application_updates(self.current_version)
+        try:
+            self.result.emit(update_available)
+        except RuntimeError:
+            # The application shut down and deleted the worker before the check finished
+            pass
+
 class StartupDialog(QDialog):
 
     """
@@ -34,9 +74,10 @@ class StartupDialog(QDialog):
         # Initialize the dialog with the parent widget
         super().__init__(parent)
         self.current_version = load_latest_version()
-        self.update_status = check_for_application_updates(self.current_version)
+        self.update_status = None
         self.is_action_in_progress = is_action_in_progress
         self.init_ui()
+        self.start_update_check()
 
     def init_ui(self):
         """
@@ -68,18 +109,34 @@ class StartupDialog(QDialog):
         for button in buttons:
             layout.addWidget(button)
 
-        # Add version label at the bottom
-        if self.update_status:
-            version_label = QLabel(f"Version: {self.current_version} (Update available!)")
-        else:
-            version_label = QLabel(f"Version: {self.current_version} (Up to date)")
-        version_label.setAlignment(Qt.AlignLeft)
-        layout.addWidget(version_label)
+        # Add version label at the bottom, updated once the update check completes
+        self.version_label = QLabel(f"Version: {self.current_version} (Checking for updates...)")
+        self.version_label.setAlignment(Qt.AlignLeft)
+        layout.addWidget(self.version_label)
 
         # Set the main layout for the dialog
         self.setLayout(layout)
         self.set_tab_order(buttons)
 
+    def start_update_check(self):
+        """Start checking for application updates in a background thread."""
+        # The application owns the worker, so it outlives this dialog and deletes itself once it reports
+        worker = UpdateCheckWorker(self.current_version, parent=QCoreApplication.instance())
+        worker.result.connect(self.update_version_label)
+        worker.result.connect(worker.deleteLater)
+        worker.start()
+
+    def update_version_label(self, update_status):
+        """
+        Update the version label with the result of the update check.
+
+        Parameters:
+        update_status (bool): Whether an application update is available.
+        """
+        self.update_status = update_status
+        suffix = "Update available!" if update_status else "Up to date"
+        self.version_label.setText(f"Version: {self.current_version} ({suffix})")
+
     @staticmethod
     def get_icon_path():
         """
@@ -88,7 +145,7 @@ class StartupDialog(QDialog):
         Returns:
         str: The full path to the icon file.
         """
-        return os.path.join(os.path.dirname(__file__), "data/icon.png")
+        return ICON_PATH
 
     @staticmethod
     def create_header_layout(icon_path):
@@ -135,8 +192,8 @@ class StartupDialog(QDialog):
         Parameters:
         buttons (list): List of QPushButton objects whose tab order needs to be set.
         """
-        for i in range(len(buttons) - 1):
-            self.setTabOrder(buttons[i], buttons[i + 1])
+        for current_button, next_button in zip(buttons, buttons[1:]):
+            self.setTabOrder(current_button, next_button)
 
     @staticmethod
     def create_button(text, click_handler):
@@ -162,7 +219,7 @@ class StartupDialog(QDialog):
         Returns:
         QPushButton: A QPushButton object for starting the application.
         """
-        button = self.create_button("Start HotKey Helper", lambda: self.emit_start_app_signal())
+        button = self.create_button("Start HotKey Helper", self.emit_start_app_signal)
         button.setDefault(True)
         return button
 
@@ -173,7 +230,7 @@ class StartupDialog(QDialog):
         Returns:
         QPushButton: A QPushButton object for opening settings.
         """
-        button = self.create_button("Settings", lambda: self.emit_open_settings_signal())
+        button = self.create_button("Settings", self.emit_open_settings_signal)
         return button
 
     def create_web_button(self):
@@ -183,7 +240,7 @@ class StartupDialog(QDialog):
         Returns:
         QPushButton: A QPushButton object for opening the website.
         """
-        button = self.create_button("Website", lambda: self.emit_open_website_signal())
+        button = self.create_button("Website", self.emit_open_website_signal)
         return button
 
     def create_close_button(self):
@@ -193,7 +250,7 @@ class StartupDialog(QDialog):
         Returns:
         QPushButton: A QPushButton object for quitting the application.
         """
-        button = self.create_button("Quit", lambda: self.emit_quit_app_signal())
+        button = self.create_button("Quit", self.emit_quit_app_signal)
         return button
 
     def emit_start_app_signal(self):
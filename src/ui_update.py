@@ -1,41 +1,38 @@
 import logging
+import threading
 
-from PySide6.QtCore import Signal, QThread, Qt
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PySide6.QtCore import Signal, QObject, QThreadPool, QCoreApplication, Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 from update_manager import fetch_hotkeys
 
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
-class DbUpdateWorker(QThread):
+class UpdateSignals(QObject):
 
-    """Worker thread to manage the database update process."""
+    """Carries the result of an update task back to the GUI thread, so the task never holds the window."""
 
     # Signals
-    finished = Signal()
+    finished = Signal(bool)
     error = Signal(str)
 
-    def __init__(self):
-        """Initialize the DbUpdateWorker."""
-        super().__init__()
-        self.success = False
-
-    def run(self):
-        """Run the update process in a separate thread."""
-        # Attempt to fetch the hotkeys from the server
-        try:
-            self.success = fetch_hotkeys()
-            self.finished.emit()
-
-        except Exception as e:
-            error_message = str(e)
-            logger.error("Error during update: %s", error_message)
-            self.error.emit(error_message)
-
-    def stop(self):
-        """Stop the update process."""
-        self.success = True
-        self.wait()
+def run_update(cancel_event, signals):
+    """
+    Run the update process on a thread pool thread.
+
+    Parameters:
+    cancel_event (threading.Event): Event set to request the update to stop.
+    signals (UpdateSignals): Signals used to report the outcome.
+    """
+    # Attempt to fetch the hotkeys from the server
+    try:
+        success = fetch_hotkeys(cancel=cancel_event.is_set)
+        signals.finished.emit(success)
+
+    except Exception as e:
+        error_message = str(e)
+        logger.error("Error during update: %s", error_message)
+        signals.error.emit(error_message)
 
 class LoadingWindow(QWidget):
 
@@ -60,46 +57,64 @@ class LoadingWindow(QWidget):
         self.text_label.setAlignment(Qt.AlignCenter)
         self.layout.addWidget(self.text_label)
 
-        # Setup the worker thread
-        self.worker = DbUpdateWorker()
-        self.thread = QThread()
-        self.worker.moveToThread(self.thread)
+        # Cancel button
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_update)
+        self.layout.addWidget(self.cancel_button)
+
+        # Event set to request the update task to stop
+        self.cancel_event = threading.Event()
 
         # Set up worker and connect signals
         self.setup_worker_connections()
 
     def setup_worker_connections(self):
         """Set up the worker connections for handling completion and errors."""
-        self.worker.finished.connect(self.update_finished)
-        self.worker.error.connect(self.handle_error)
-        self.thread.started.connect(self.worker.run)
+        # The application owns the signals object, so it outlives this window and is deleted on the GUI thread
+        self.update_signals = UpdateSignals(QCoreApplication.instance())
+
+        # Update signals are emitted from a pool thread, so always deliver them queued
+        self.update_signals.finished.connect(self.update_finished, Qt.QueuedConnection)
+        self.update_signals.error.connect(self.handle_error, Qt.QueuedConnection)
+        self.update_signals.finished.connect(self.update_signals.deleteLater, Qt.QueuedConnection)
+        self.update_signals.error.connect(self.update_signals.deleteLater, Qt.QueuedConnection)
 
     def start_update(self):
-        """Start the worker thread to begin the update process."""
+        """Start the update task on the global thread pool."""
         self.show()
-        self.thread.start()
 
-    def update_finished(self):
-        """Handle actions to take once the update process is finished."""
+        # Hand the task only the cancel event and signals, never the widget itself
+        cancel_event, signals = self.cancel_event, self.update_signals
+        QThreadPool.globalInstance().start(lambda: run_update(cancel_event, signals))
+
+    def update_finished(self, success):
+        """
+        Handle actions to take once the update process is finished.
+
+        Parameters:
+        success (bool): Whether the update completed successfully.
+        """
         # Update the text label based on the success of the update
-        if self.worker.success:
+        if self.cancel_event.is_set():
+            self.text_label.setText("Update cancelled.")
+        elif success:
             self.text_label.setText("Update completed successfully!")
         else:
             self.text_label.setText("Update failed. Please try again later.")
 
         # Emit the signal to indicate the update is completed
-        self.thread.quit()
-        self.thread.wait()
         self.update_completed_signal.emit()
-        self.cleanup()
-
-    def cleanup(self):
-        """Clean up worker signals and resources."""
-        # Disconnect signals and delete the worker
-        for signal in [self.worker.finished, self.worker.error]:
-            signal.disconnect()
-        self.worker.deleteLater()
-        self.worker = None
+
+    def cancel_update(self):
+        """
+        Request the update process to stop without blocking the user interface.
+
+        The update task checks the cancel event between download chunks and then
+        emits its finished signal, which drives the remaining teardown.
+        """
+        self.cancel_event.set()
+        self.text_label.setText("Cancelling update...")
+        self.cancel_button.setEnabled(False)
 
     def handle_error(self, error_message):
         """
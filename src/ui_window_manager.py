@@ -1,13 +1,15 @@
 import webbrowser
 import logging
 import os
-import platform
+import threading
+import file_utils
 
-from PySide6.QtCore import QCoreApplication, QTimer
+from pathlib import Path
+from PySide6.QtCore import QTimer, QThreadPool
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 from ui_startup import StartupDialog
-from ui_shortcuts import ShortcutDisplay
+from ui_shortcuts import ShortcutDisplay, BASE_DIR, ICON_RELATIVE_PATH
 from ui_settings import SettingsWindow
 from ui_update import LoadingWindow
 from settings_manager import SettingsManager
@@ -16,6 +18,12 @@ from update_manager import check_for_db_updates
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+# Milliseconds background tasks are given to finish when the application quits
+SHUTDOWN_TIMEOUT_MS = 200
+
+# Application directory that stylesheets must be loaded from
+APP_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 class WindowManager:
 
     """
@@ -24,6 +32,14 @@ class WindowManager:
     and transitions between these components.
     """
 
+    # Loaded stylesheets keyed by absolute path, stored with the file's file_utils key
+    _qss_cache = {}
+
+    # Validated absolute stylesheet paths keyed by requested path, None if rejected
+    _validated_qss_paths = {}
+
+    # Guards the stylesheet caches, which are also filled by the preload thread
+    _qss_lock = threading.Lock()
 
     def __init__(self, app):
         """
@@ -34,12 +50,13 @@ class WindowManager:
         """
         self.app = app
         self.settings_manager = SettingsManager()
+
+        # Preload both themes in the background so switching themes later is a cache lookup
+        threading.Thread(target=self._preload_qss, daemon=True).start()
+
         # Load the appropriate stylesheet based on the theme
-        if self.settings_manager.get_setting("theme") == "dark":
-            stylesheet = self.load_stylesheet("data/dark.qss")
-        else:
-            stylesheet = self.load_stylesheet("data/light.qss")
-        self.app.setStyleSheet(stylesheet)
+        self._applied_theme = None
+        self._apply_theme(self.settings_manager.get_setting("theme"))
 
         # Initialize window components as None; they will be lazily created
         self.startup_dialog = None
@@ -48,7 +65,7 @@ class WindowManager:
         self.loading_window = None
 
         # Set the application icon based on the operating system
-        self.base_dir = os.path.dirname(__file__)
+        self.base_dir = BASE_DIR
         self.app.setWindowIcon(QIcon(self.setup_icon_paths(self.base_dir)))
 
     def setup_icon_paths(self, base_dir):
@@ -57,56 +74,44 @@ class WindowManager:
 
         Parameters:
         - base_dir (str): Base directory containing icon files.
+
+        Returns:
+        - str: Path to the icon for the current operating system.
         """
-        # Set the icon path based on the operating system
-        self.icon_path_win = os.path.join(base_dir, "data/icon.ico")
-        self.icon_path_mac = os.path.join(base_dir, "data/icon.icns")
-        self.icon_path_linux = os.path.join(base_dir, "data/icon.png")
-
-        # Return the appropriate icon path based on the operating system
-        self.icon_path = (
-            self.icon_path_win if platform.system() == "Windows"
-            else self.icon_path_mac if platform.system() == "Darwin"
-            else self.icon_path_linux
-        )
+        self.icon_path = os.path.join(base_dir, ICON_RELATIVE_PATH)
+        return self.icon_path
 
     def initialize_startup_dialog(self):
         """Lazily initialize the startup dialog if it has not been created yet."""
         if self.startup_dialog is None:
             self.startup_dialog = StartupDialog()
-        self.connect_signals_startup_dialog()
+            self.connect_signals_startup_dialog()
 
     def initialize_shortcut_display(self):
         """Lazily initialize the shortcut display if it has not been created yet."""
         if self.shortcut_display is None:
             self.shortcut_display = ShortcutDisplay(self.settings_manager)
-        self.connect_signals_shortcut_display()
+            self.connect_signals_shortcut_display()
 
     def initialize_settings_window(self):
         """Lazily initialize the settings window if it has not been created yet."""
         if self.settings_window is None:
             self.settings_window = SettingsWindow(self.settings_manager)
-        self.connect_signals_settings_window()
-
-    def disconnect_startup_dialog(self):
-        """Disconnect all signals connected to the startup dialog."""
-        self.startup_dialog.start_app_signal.disconnect()
-        self.startup_dialog.open_website_signal.disconnect()
-        self.startup_dialog.open_settings_signal.disconnect()
-        self.startup_dialog.quit_app_signal.disconnect()
+            self.connect_signals_settings_window()
+
+    def release_startup_dialog(self):
+        """Release the startup dialog; Qt drops its connections when it is destroyed."""
+        self.startup_dialog.deleteLater()
         self.startup_dialog = None
 
-    def disconnect_shortcut_display(self):
-        """Disconnect all signals connected to the shortcut display."""
-        self.shortcut_display.tray_icon.open_startup_signal.disconnect()
-        self.shortcut_display.tray_icon.quit_app_signal.disconnect()
+    def release_shortcut_display(self):
+        """Release the shortcut display; Qt drops its connections when it is destroyed."""
+        self.shortcut_display.deleteLater()
         self.shortcut_display = None
 
-    def disconnect_settings_window(self):
-        """Disconnect all signals connected to the settings window."""
-        self.settings_window.save_settings_signal.disconnect()
-        self.settings_window.reset_settings_signal.disconnect()
-        self.settings_window.close_settings_signal.disconnect()
+    def release_settings_window(self):
+        """Release the settings window; Qt drops its connections when it is destroyed."""
+        self.settings_window.deleteLater()
         self.settings_window = None
 
     def run(self):
@@ -114,19 +119,15 @@ class WindowManager:
         Start the application by checking if a database update is needed and initializing
         the appropriate window components.
         """
-        # Set up the connection for update completion
-        self.setup_signal_connection()
-
         # Check if an update is needed
         if check_for_db_updates():
+            # Only create the loading window when an update actually runs
+            self.setup_signal_connection()
             self.loading_window.start_update()
         else:
             # Proceed to first run if no update is needed
             QTimer.singleShot(0, self.first_run)
 
-        # Ensure the event loop processes all pending events
-        QCoreApplication.processEvents()
-
     def setup_signal_connection(self):
         """
         Set up the connection between the LoadingWindow and the WindowManager to handle
@@ -173,39 +174,107 @@ class WindowManager:
         self.settings_window.reset_settings_signal.connect(self.reset_settings)
         self.settings_window.close_settings_signal.connect(self.close_settings)
 
-    @staticmethod
-    def load_stylesheet(file_path):
+    def _apply_theme(self, name):
+        """
+        Apply the stylesheet of the given theme to the application.
+
+        Setting a stylesheet makes Qt re-parse it and re-polish every widget, so
+        nothing is done when the theme is already the one applied.
+
+        Parameters:
+        name (str): The theme name, either "dark" or "light".
+        """
+        if name == self._applied_theme:
+            return
+        self.app.setStyleSheet(self._stylesheet_for_theme(name))
+        self._applied_theme = name
+
+    def _stylesheet_for_theme(self, name):
+        """
+        Get the stylesheet matching the given theme.
+
+        Parameters:
+        name (str): The theme name, either "dark" or "light".
+
+        Returns:
+        str: The contents of the dark or light stylesheet.
+        """
+        if name == "dark":
+            return self.load_stylesheet("data/dark.qss")
+        return self.load_stylesheet("data/light.qss")
+
+    @classmethod
+    def _preload_qss(cls):
+        """Load every theme stylesheet into the cache; runs on a background thread."""
+        for file_path in ("data/dark.qss", "data/light.qss"):
+            cls.load_stylesheet(file_path)
+
+    @classmethod
+    def load_stylesheet(cls, file_path):
         """
         Load the QSS stylesheet from the given file path.
 
+        The contents are cached per file and only read again once the file's
+        file_utils key changes.
+
         Parameters:
         file_path (str): The path to the QSS file.
 
         Returns:
         str: The contents of the stylesheet file.
         """
-        # Attempt to load the stylesheet from the file path
-        try:
-            # Validate that the file path is within the expected directory
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            abs_file_path = os.path.abspath(file_path)
-
-            # Check if the file path is within the base directory
-            if not abs_file_path.startswith(base_dir):
-                logger.error("Invalid file path: %s is outside the application directory", file_path)
+        # Serialize loads so a caller waits for a preload of the same file in progress
+        with cls._qss_lock:
+            # Attempt to load the stylesheet from the file path
+            try:
+                # Validate that the file path is within the expected directory
+                abs_file_path = cls._validate_stylesheet_path(file_path)
+                if abs_file_path is None:
+                    logger.error("Invalid file path: %s is outside the application directory", file_path)
+                    return ""
+
+                # Check if the file exists
+                try:
+                    file_key = file_utils.get_file_key(abs_file_path)
+                except FileNotFoundError:
+                    logger.error("File not found: %s", abs_file_path)
+                    return ""
+
+                # Reuse the cached stylesheet if the file is unchanged since it was read
+                cached = cls._qss_cache.get(abs_file_path)
+                if cached is not None and cached[0] == file_key:
+                    return cached[1]
+
+                # Read the file with the validated path and decode it in one go
+                stylesheet = Path(abs_file_path).read_bytes().decode("utf-8")
+                cls._qss_cache[abs_file_path] = (file_key, stylesheet)
+                return stylesheet
+            except Exception as e:
+                logger.error("Failed to load stylesheet: %s", e)
                 return ""
 
-            # Check if the file exists
-            if not os.path.isfile(abs_file_path):
-                logger.error("File not found: %s", abs_file_path)
-                return ""
+    @classmethod
+    def _validate_stylesheet_path(cls, file_path):
+        """
+        Resolve a stylesheet path and check that it lies within the application directory.
+
+        The result is remembered per path, so the check only runs once for each file.
 
-            # Open the file with the validated path
-            with open(abs_file_path, "r") as file:
-                return file.read()
-        except Exception as e:
-            logger.error("Failed to load stylesheet: %s", e)
-            return ""
+        Parameters:
+        file_path (str): The path to the QSS file.
+
+        Returns:
+        str or None: The absolute file path, or None if it is outside the application directory.
+        """
+        if file_path not in cls._validated_qss_paths:
+            abs_file_path = os.path.abspath(file_path)
+            try:
+                is_inside = os.path.commonpath([abs_file_path, APP_BASE_DIR]) == APP_BASE_DIR
+            except ValueError:
+                # Paths on different drives have no common path
+                is_inside = False
+            cls._validated_qss_paths[file_path] = abs_file_path if is_inside else None
+        return cls._validated_qss_paths[file_path]
 
     def start_app(self):
         """Transition from the StartupDialog to the ShortcutDisplay window."""
@@ -216,25 +285,31 @@ class WindowManager:
         # Close the StartupDialog if it exists
         if self.startup_dialog:
             self.startup_dialog.close()
-            self.disconnect_startup_dialog()
+            self.release_startup_dialog()
 
     @staticmethod
     def open_website():
-        """Placeholder method for opening the website."""
+        """Open the website in the default web browser without blocking the user interface."""
         url = "https://hotkey-helper.web.app/index.html"
-        webbrowser.open(url)
+        # Launching the browser can block while its process spawns, so do it on a daemon thread
+        threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
 
     def quit_app(self):
         """Quit the application."""
         # Close the ShortcutDisplay and StartupDialog if they exist
         if self.shortcut_display:
-            self.shortcut_display.tray_icon.close()
-            self.disconnect_shortcut_display()
+            self.shortcut_display.tray_icon.hide()
+            self.release_shortcut_display()
 
         # Close the StartupDialog if it exists
         if self.startup_dialog:
             self.startup_dialog.close()
-            self.disconnect_startup_dialog()
+            self.release_startup_dialog()
+
+        # Cancel a running database update and give background tasks a short deadline
+        if self.loading_window:
+            self.loading_window.cancel_event.set()
+        QThreadPool.globalInstance().waitForDone(SHUTDOWN_TIMEOUT_MS)
         QApplication.quit()
 
     def show_startup(self):
@@ -242,15 +317,15 @@ class WindowManager:
         # Initialize the StartupDialog and show it
         self.initialize_startup_dialog()
         self.startup_dialog.show()
-        self.shortcut_display.timer.stop()
         # Close the ShortcutDisplay if it exists
         if self.shortcut_display:
+            self.shortcut_display.timer.stop()
             self.shortcut_display.close()
-            self.disconnect_shortcut_display()
+            self.release_shortcut_display()
         # Close the SettingsWindow if it exists
         if self.settings_window:
             self.settings_window.close()
-            self.disconnect_settings_window()
+            self.release_settings_window()
 
     def open_settings(self):
         """Transition from the StartupDialog to the SettingsWindow."""
@@ -259,37 +334,29 @@ class WindowManager:
         # Close the StartupDialog if it exists
         if self.startup_dialog:
             self.startup_dialog.close()
-            self.disconnect_startup_dialog()
+            self.release_startup_dialog()
 
     def save_settings(self):
         """Save the settings and return to the StartupDialog."""
         self.initialize_startup_dialog()
         # Apply the theme based on updated settings
-        if self.settings_manager.get_setting("theme") == "dark":
-            stylesheet = self.load_stylesheet("data/dark.qss")
-        else:
-            stylesheet = self.load_stylesheet("data/light.qss")
-        self.app.setStyleSheet(stylesheet)
+        self._apply_theme(self.settings_manager.get_setting("theme"))
         self.startup_dialog.show()
         # Close the SettingsWindow if it exists
         if self.settings_window:
             self.settings_window.close()
-            self.disconnect_settings_window()
+            self.release_settings_window()
 
     def reset_settings(self):
         """Reset settings to their default values and return to the StartupDialog."""
         self.initialize_startup_dialog()
         # Apply the default theme
-        if self.settings_manager.get_setting("theme") == "dark":
-            stylesheet = self.load_stylesheet("data/dark.qss")
-        else:
-            stylesheet = self.load_stylesheet("data/light.qss")
-        self.app.setStyleSheet(stylesheet)
+        self._apply_theme(self.settings_manager.get_setting("theme"))
         self.startup_dialog.show()
         # Close the SettingsWindow if it exists
         if self.settings_window:
             self.settings_window.close()
-            self.disconnect_settings_window()
+            self.release_settings_window()
 
     def close_settings(self):
         """Close the SettingsWindow and return to the StartupDialog."""
@@ -298,4 +365,4 @@ class WindowManager:
         # Close the SettingsWindow if it exists
         if self.settings_window:
             self.settings_window.close()
-            self.disconnect_settings_window()
+            self.release_settings_window()
@@ -1,7 +1,27 @@
 import os
-import json
+import queue
+import atexit
+import hashlib
+import time
 import logging
+import functools
+import threading
 import requests
+import json_backend
+import file_utils
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+from packaging.version import InvalidVersion, Version
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+# Prefer ijson to parse the hotkeys listing incrementally while it downloads
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Get a logger for this module
 logger = logging.getLogger(__name__)
@@ -12,8 +32,10 @@ BASE_DIR = os.path.dirname(__file__)
 LOCAL_DB_PATH = os.path.join(BASE_DIR, "data/local_shortcut_db.json")
 TEMP_DB_PATH = os.path.join(BASE_DIR, "data/temp_shortcut_db.json")
 UPDATE_LOG_PATH = os.path.join(BASE_DIR, "data/update_log.json")
+VERSION_ETAG_PATH = os.path.join(BASE_DIR, "data/version_etag.txt")
 
-def load_api_key():
+@functools.lru_cache(maxsize=1)
+def load_api_key() -> Optional[str]:
     """Load the Firestore API key from a local file."""
     # Define the path to the API key file
     api_file = "data/api_key.txt"
@@ -28,8 +50,98 @@ def load_api_key():
 PROJECT_ID = "hotkey-helper"
 API_KEY = load_api_key()
 FIRESTORE_URL = f"https://firestore.googleapis.com/v1/projects/{PROJECT_ID}/databases/(default)/documents"
+HOTKEYS_URL = f"{FIRESTORE_URL}/hotkeys/?key={API_KEY}"
+# Only the total_shortcuts field of the counters document is ever read, so mask out the rest
+COUNTERS_URL = f"{FIRESTORE_URL}/hotkeys_metadata/counters?key={API_KEY}&mask.fieldPaths=total_shortcuts"
 
-def fetch_hotkeys():
+# Size of the chunks read from streamed responses between cancellation checks
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Seconds to wait for a connection or for data before a request fails
+REQUEST_TIMEOUT = 10
+
+# Location of the latest published version number and how long a fetched value is reused
+LATEST_VERSION_URL = "https://raw.githubusercontent.com/rob1010/Hotkey-Helper/main/latest_version.txt"
+VERSION_CACHE_DURATION = 5 * 60
+
+# (connect, read) timeouts for the counters and version checks, kept short so a stalled request can't hold up startup
+CHECK_TIMEOUT = (3, 5)
+
+class _Cache:
+    """A single cached value and the stamp it was stored with, shared safely between threads."""
+
+    __slots__ = ("value", "stamp", "lock")
+
+    def __init__(self):
+        self.value = None
+        self.stamp = None
+        self.lock = threading.Lock()
+
+    def get(self) -> Any:
+        """Return the value regardless of its stamp, or None if nothing is stored."""
+        with self.lock:
+            return self.value
+
+    def get_fresh(self, max_age: float) -> Any:
+        """Return the value if it was stored less than max_age seconds ago, otherwise None."""
+        with self.lock:
+            if self.value is not None and time.monotonic() - self.stamp < max_age:
+                return self.value
+        return None
+
+    def get_matching(self, stamp: Any) -> Any:
+        """Return the value if it was stored with the given stamp, otherwise None."""
+        with self.lock:
+            if self.value is not None and self.stamp == stamp:
+                return self.value
+        return None
+
+    def set(self, value: Any, stamp: Any = None) -> None:
+        """Store a value, stamped with the current monotonic time unless a stamp is given."""
+        with self.lock:
+            self.value = value
+            self.stamp = time.monotonic() if stamp is None else stamp
+
+# Last fetched remote version
+_remote_version_cache = _Cache()
+
+# Seconds a fetched remote shortcut count is reused, e.g. by the download that follows an update check
+COUNT_CACHE_DURATION = 30
+
+# Last successfully fetched remote shortcut count
+_remote_count_cache = _Cache()
+
+# ETag of the last counters document response and the count it carried
+_counters_etag_cache = _Cache()
+
+# Errors raised for malformed or truncated JSON by whichever parser is in use
+JSON_DECODE_ERRORS = (json_backend.JSONDecodeError, ijson.JSONError) if ijson else (json_backend.JSONDecodeError,)
+
+@functools.lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Create the shared HTTP session on first use, so importing this module stays cheap for offline callers.
+
+    Returns:
+        requests.Session: A session whose pooled keep-alive connections are reused by Firestore and GitHub requests.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.5))
+    session.mount("https://", adapter)
+
+    # The counters and version checks run during startup, some on the GUI thread, so they fail fast without retries.
+    # Retries are chosen per request by the adapter, so the check adapter borrows the main pool manager and the
+    # download that follows the counters check reuses its connection.
+    check_adapter = HTTPAdapter(max_retries=0)
+    check_adapter.poolmanager = adapter.poolmanager
+    for check_url_prefix in (f"{FIRESTORE_URL}/hotkeys_metadata/", LATEST_VERSION_URL):
+        session.mount(check_url_prefix, check_adapter)
+
+    # Ask for compressed bodies explicitly; the verbose Firestore value wrapping compresses very well
+    session.headers["Accept-Encoding"] = "gzip"
+    return session
+
+def fetch_hotkeys(cancel: Optional[Callable[[], bool]] = None) -> bool:
     """
     Fetch the 'hotkeys' collection from Firestore, transform it, and save to local storage.
 
@@ -39,81 +151,201 @@ def fetch_hotkeys():
     Returns:
         bool: True if completed successfully, False if canceled or an error occurred.
     """
+    # Reuse the count fetched by the preceding update check, or request it alongside the download
+    db_lenght = get_cached_total_shortcuts_count()
+    count_future = None
+    if db_lenght is None:
+        count_executor = ThreadPoolExecutor(max_workers=1)
+        count_future = count_executor.submit(get_total_shortcuts_count)
+        count_executor.shutdown(wait=False)
+
     # Fetch data from Firestore with error handling
     try:
-        hotkeys_response = requests.get(f"{FIRESTORE_URL}/hotkeys/?key={API_KEY}")
-        hotkeys_response.raise_for_status()  # Raise an exception for HTTP errors
-        db_temp = hotkeys_response.json()
-    except requests.exceptions.RequestException:
+        # Closing the streamed response on every path keeps a half-read connection from being abandoned
+        with get_session().get(HOTKEYS_URL, stream=True, timeout=REQUEST_TIMEOUT) as hotkeys_response:
+            hotkeys_response.raise_for_status()  # Raise an exception for HTTP errors
+
+            # Transform the data from Firestore format to a simplified structure
+            if ijson is not None:
+                db = transform_firestore_documents(iter_response_documents(hotkeys_response, cancel))
+            else:
+                content = read_response_content(hotkeys_response, cancel)
+                if content is None:
+                    logger.info("Hotkeys update cancelled")
+                    return False
+                db = transform_firestore_data(json_backend.loads(content))
+    except (requests.exceptions.RequestException, Urllib3HTTPError):
+        # Reading the raw stream raises urllib3 errors directly rather than wrapped by requests
         logger.error("Error fetching hotkeys from Firestore")
         return False
-    except json.JSONDecodeError as e:
+    except JSON_DECODE_ERRORS as e:
+        # A cancelled stream ends early and surfaces as truncated JSON
+        if cancel and cancel():
+            logger.info("Hotkeys update cancelled")
+            return False
         logger.error("Error decoding JSON response: %s", e)
         return False
 
-    # Transform the data from Firestore format to a simplified structure
-    db = transform_firestore_data(db_temp)
-
-    # Write the transformed data to a temporary file
-    try:
-        with open(TEMP_DB_PATH, "w") as f:
-            json.dump(db, f, indent=2)
-    except Exception as e:
-        logger.error("Error writing to temporary file %s: %s", TEMP_DB_PATH, e)
+    # Stop before touching local storage if the update was cancelled
+    if cancel and cancel():
+        logger.info("Hotkeys update cancelled")
         return False
 
-    # Read the temporary file to verify it was written correctly
-    try:
-        with open(TEMP_DB_PATH, "r") as f:
-            json.load(f)  # Just verify it can be loaded
-    except Exception as e:
-        logger.error("Error reading temporary file %s: %s", TEMP_DB_PATH, e)
-        return False
+    # Fingerprint the data with sorted keys so the hash doesn't depend on the order Firestore lists fields in
+    db_hash = hashlib.blake2b(json_backend.dumps(db, sort_keys=True), digest_size=16).hexdigest()
+
+    # Write the transformed data to a temporary file and swap it in for the local database
+    if db_hash == load_update_log().get("db_hash") and os.path.exists(LOCAL_DB_PATH):
+        logger.info("Local database already matches the downloaded hotkeys")
+    else:
+        try:
+            _write_atomic(LOCAL_DB_PATH, json_backend.dumps(db, indent=True), TEMP_DB_PATH)
+        except OSError as e:
+            logger.error("Error writing local database %s: %s", LOCAL_DB_PATH, e)
+            return False
 
     # Update update log with the number of processed shortcuts
-    db_lenght = get_total_shortcuts_count()
-    log_update(db_lenght)
+    if count_future is not None:
+        db_lenght = count_future.result()
+    log_update(db_lenght, db_hash)
     return True
 
-def transform_firestore_data(firestore_data):
+def _write_atomic(path: str, data: bytes, tmp_path: Optional[str] = None) -> None:
+    """
+    Write bytes to a temporary file, flush them to disk and atomically replace the target with it.
+
+    Args:
+        path (str): The file to replace.
+        data (bytes): The complete file contents.
+        tmp_path (str, optional): The temporary file to write first. Defaults to the target path plus ".tmp".
+    """
+    tmp_path = tmp_path or f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        # os.write may accept fewer bytes than given, so keep writing until everything is out
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+def read_response_content(response: requests.Response, cancel: Optional[Callable[[], bool]] = None) -> Optional[bytes]:
+    """
+    Read a streamed response body chunk by chunk, checking for cancellation in between.
+
+    Args:
+        response (requests.Response): A response requested with stream=True.
+        cancel (callable, optional): A function to call to determine if the process should be canceled.
+
+    Returns:
+        bytes or None: The response body, or None if the download was canceled.
+    """
+    chunks = []
+    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+        if cancel and cancel():
+            response.close()
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+class CancellableReader:
+    """File-like view of a raw response stream that reads as exhausted once the update is canceled."""
+
+    def __init__(self, raw: Any, cancel: Optional[Callable[[], bool]] = None):
+        self.raw = raw
+        self.cancel = cancel
+
+    def read(self, size: int = -1) -> bytes:
+        if self.cancel and self.cancel():
+            return b""
+        return self.raw.read(size)
+
+def iter_response_documents(response: requests.Response, cancel: Optional[Callable[[], bool]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the documents of a streamed Firestore listing as they are parsed, without building the whole response.
+
+    Args:
+        response (requests.Response): A response requested with stream=True.
+        cancel (callable, optional): A function to call to determine if the process should be canceled.
+
+    Returns:
+        Iterator[dict]: The Firestore documents in the listing.
+    """
+    # Let urllib3 undo any transfer compression before the parser sees the bytes
+    response.raw.decode_content = True
+    reader = CancellableReader(response.raw, cancel)
+    return ijson.items(reader, "documents.item", buf_size=DOWNLOAD_CHUNK_SIZE)
+
+# Shared empty mapping returned when a Firestore value carries no fields
+_EMPTY_FIELDS = {}
+
+def _map_fields(value: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the fields of a Firestore mapValue, or an empty mapping if it has none."""
+    map_value = value.get("mapValue")
+    return map_value.get("fields", _EMPTY_FIELDS) if map_value else _EMPTY_FIELDS
+
+def _simplify_hotkey(hotkey_details: Dict[str, Any]) -> Dict[str, str]:
+    """Reduce a Firestore hotkey value to its description and category strings."""
+    details = _map_fields(hotkey_details)
+    description = details.get("Description")
+    category = details.get("Category")
+    return {
+        "Description": description.get("stringValue", "") if description else "",
+        "Category": category.get("stringValue", "") if category else ""
+    }
+
+def transform_firestore_data(firestore_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform Firestore data into a simplified structure.
 
     Args:
         firestore_data (dict): The Firestore response data.
 
+    Returns:
+        dict: The transformed data in a simplified structure.
+    """
+    return transform_firestore_documents(firestore_data.get("documents", ()))
+
+def transform_firestore_documents(documents: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Transform an iterable of Firestore documents into a simplified structure.
+
+    Args:
+        documents (Iterable[dict]): The Firestore documents.
+
     Returns:
         dict: The transformed data in a simplified structure.
     """
     simplified_data = {}
 
     # Iterate through each document in the Firestore response
-    for doc in firestore_data.get("documents", []):
+    for doc in documents:
         # Extract the document name (e.g., "Adobe Acrobat" from the path)
-        doc_name = doc["name"].split("/")[-1]
+        doc_name = doc["name"].rpartition("/")[2]
 
-        # Initialize the structure for this document
-        simplified_data[doc_name] = {}
+        # Build each OS (e.g., "Windows", "macOS") and its hotkeys in one pass
+        simplified_data[doc_name] = {
+            os_key: {
+                hotkey: _simplify_hotkey(hotkey_details)
+                for hotkey, hotkey_details in _map_fields(os_value).items()
+            }
+            for os_key, os_value in doc["fields"].items()
+        }
 
-        # Process the fields (e.g., "Windows", "macOS")
-        for os_key, os_value in doc["fields"].items():
-            simplified_data[doc_name][os_key] = {}
-
-            # Extract the map of hotkeys
-            hotkeys_map = os_value.get("mapValue", {}).get("fields", {})
+    return simplified_data
 
-            # Process each hotkey
-            for hotkey, hotkey_details in hotkeys_map.items():
-                details = hotkey_details.get("mapValue", {}).get("fields", {})
-                simplified_hotkey = {
-                    "Description": details.get("Description", {}).get("stringValue", ""),
-                    "Category": details.get("Category", {}).get("stringValue", "")
-                }
-                simplified_data[doc_name][os_key][hotkey] = simplified_hotkey
+def get_cached_total_shortcuts_count() -> Optional[int]:
+    """
+    Return the remote shortcut count if it was fetched recently.
 
-    return simplified_data
+    Returns:
+        int or None: The recently fetched count, or None if it is missing or stale.
+    """
+    return _remote_count_cache.get_fresh(COUNT_CACHE_DURATION)
 
-def get_total_shortcuts_count():
+def get_total_shortcuts_count() -> int:
     """
     Get the total number of shortcuts from Firestore's 'hotkeys_metadata/counters'
     document (reading the 'total_shortcuts' field).
@@ -121,55 +353,96 @@ def get_total_shortcuts_count():
     Returns:
         int: Total number of shortcuts, or 0 if an error occurs.
     """
+    cached_count = get_cached_total_shortcuts_count()
+    if cached_count is not None:
+        return cached_count
+
+    # Revalidate with the last ETag so an unchanged counter costs only a 304 exchange
+    etag, etag_count = _counters_etag_cache.get() or (None, None)
+    headers = {"If-None-Match": etag} if etag else None
+
     # Fetch data from Firestore with error handling
     try:
-        url = f"{FIRESTORE_URL}/hotkeys_metadata/counters?key={API_KEY}"
-        response = requests.get(url)
+        response = get_session().get(COUNTERS_URL, headers=headers, timeout=CHECK_TIMEOUT)
+        if response.status_code == 304:
+            _remote_count_cache.set(etag_count)
+            return etag_count
         if response.status_code == 200:
-            data = response.json()
+            data = json_backend.loads(response.content)
             total = data.get("fields", {}).get("total_shortcuts", {}).get("integerValue")
             if total is not None:
-                return int(total)
+                total = int(total)
+                _remote_count_cache.set(total)
+                if response.headers.get("ETag"):
+                    _counters_etag_cache.set((response.headers["ETag"], total))
+                return total
             logger.error("Total shortcuts field not found in the response.")
         else:
             logger.error("Error getting total shortcuts count: %s %s", response.status_code, response.text)
         return 0
-    except requests.exceptions.RequestException:
-        logger.error("Error getting total shortcuts count: %s %s", response.status_code, response.text)
+    except requests.exceptions.RequestException as e:
+        logger.error("Error getting total shortcuts count: %s", e)
         return 0
-    except Exception as e:
-        logger.error("Exception in get_total_shortcuts_count: %s", e)
+    except (ValueError, AttributeError) as e:
+        # Malformed JSON or an unexpected document shape; JSONDecodeError is a ValueError
+        logger.error("Unexpected counters document in get_total_shortcuts_count: %s", e)
         return 0
 
-def get_local_shortcuts_count():
+# Parsed update log, stamped with the log's file_utils key
+_update_log_cache = _Cache()
+
+def load_update_log() -> Dict[str, Any]:
     """
-    Get the total number of shortcuts from the local update log file.
+    Load the local update log file.
+
+    The parsed log is cached against its file_utils key, so repeated calls only cost
+    a stat until the log is rewritten.
 
     Returns:
-    int: The number of local shortcuts, or 0 if an error occurs.
+        dict: The update log entries, or an empty dict if the log is missing or unreadable.
     """
-    # Check if the file exists before trying to open it
+    # Let any queued write land first so callers see the latest log
+    _log_queue.join()
+
+    # A single stat tells both whether the log exists and whether it changed
     try:
-        if not os.path.exists(UPDATE_LOG_PATH):
-            return 0
+        file_key = file_utils.get_file_key(UPDATE_LOG_PATH)
+    except FileNotFoundError:
+        return {}
+    except OSError as e:
+        logger.error("Unexpected error reading update log file: %s", e)
+        return {}
 
-        # Open and read the local update log file
-        try:
-            with open(UPDATE_LOG_PATH, 'r') as update_log_file:
-                update_log = json.load(update_log_file)
-        except json.JSONDecodeError:
-            logger.error("Error reading update log file: Invalid JSON format.")
-            return 0
-
-        # Retrieve the stored count, defaulting to 0 if the key is missing
-        stored_count = update_log.get('processed_shortcuts', 0)
-        return stored_count
-    except Exception as e:
+    cached_log = _update_log_cache.get_matching(file_key)
+    if cached_log is not None:
+        return cached_log
+
+    # Open and read the local update log file
+    try:
+        with open(UPDATE_LOG_PATH, 'rb') as update_log_file:
+            update_log = json_backend.loads(update_log_file.read())
+    except json_backend.JSONDecodeError:
+        logger.error("Error reading update log file: Invalid JSON format.")
+        return {}
+    except OSError as e:
         logger.error("Unexpected error reading update log file: %s", e)
-        return 0
+        return {}
+
+    _update_log_cache.set(update_log, file_key)
+    return update_log
+
+def get_local_shortcuts_count() -> int:
+    """
+    Get the total number of shortcuts from the local update log file.
+
+    Returns:
+    int: The number of local shortcuts, or 0 if an error occurs.
+    """
+    # Retrieve the stored count, defaulting to 0 if the key is missing
+    return load_update_log().get('processed_shortcuts', 0)
 
 # Function to determine if an update is needed
-def check_for_db_updates():
+def check_for_db_updates() -> bool:
     """
     Check if a database update is needed by comparing local and remote shortcut counts.
 
@@ -186,27 +459,64 @@ def check_for_db_updates():
     return True
 
 
-def log_update(processed_shortcuts):
+def log_update(processed_shortcuts: int, db_hash: Optional[str] = None) -> None:
     """
-    Log the update status and processed shortcuts to a JSON file.
+    Log the processed shortcuts to a JSON file.
+
+    The entry is handed to a background writer thread, so callers never wait on the disk.
 
     Parameters:
-    status (str): The status of the update (e.g., "completed", "cancelled", "failed").
     processed_shortcuts (int): The number of shortcuts processed during the update.
+    db_hash (str, optional): BLAKE2b fingerprint of the local database written by the update.
     """
-    # Create a log entry with the update status and processed shortcuts
+    # Create a log entry with the processed shortcuts
     log_entry = {
-        "processed_shortcuts": processed_shortcuts,  # Subtract 1 to account for the final increment
+        "processed_shortcuts": processed_shortcuts,
     }
-    try:
-        # Write log entry to the file, overriding existing content
-        with open(UPDATE_LOG_PATH, 'w') as log_file:
-            json.dump(log_entry, log_file, indent=4)
-        logger.error("Update log saved to %s", UPDATE_LOG_PATH)
-    except Exception as e:
-        logger.error("Failed to write update log: %s", e)
-
-def load_latest_version():
+    if db_hash is not None:
+        log_entry["db_hash"] = db_hash
+    _start_update_log_writer()
+    _log_queue.put(log_entry)
+
+def _start_update_log_writer() -> None:
+    """Start the update log writer thread on first use and drain its queue before the interpreter exits."""
+    global _log_writer_started
+    with _log_writer_lock:
+        if _log_writer_started:
+            return
+        threading.Thread(target=_run_update_log_writer, name="update-log-writer", daemon=True).start()
+        atexit.register(_log_queue.join)
+        _log_writer_started = True
+
+def _run_update_log_writer() -> None:
+    """Write queued update log entries, collapsing a backlog into its most recent entry."""
+    while True:
+        log_entry = _log_queue.get()
+        pending = 1
+        while True:
+            try:
+                log_entry = _log_queue.get_nowait()
+            except queue.Empty:
+                break
+            pending += 1
+        try:
+            # Write log entry to the file, overriding existing content
+            _write_atomic(UPDATE_LOG_PATH, json_backend.dumps(log_entry, indent=True))
+            logger.info("Update log saved to %s", UPDATE_LOG_PATH)
+        # Deliberately broad: if the writer thread died, readers joining the queue would block forever
+        except Exception as e:
+            logger.error("Failed to write update log: %s", e)
+        finally:
+            for _ in range(pending):
+                _log_queue.task_done()
+
+# Update log entries waiting for the writer thread, which is started by the first log_update call
+_log_queue = queue.Queue()
+_log_writer_lock = threading.Lock()
+_log_writer_started = False
+
+@functools.lru_cache(maxsize=1)
+def load_latest_version() -> str:
     """Load the latest version number from a local file."""
     version_file = "data/latest_version.txt"
     try:
@@ -214,11 +524,78 @@ def load_latest_version():
             return f.read().strip()
     except FileNotFoundError:
         return "1.0.0"
-    except IOError as e:
+    except OSError as e:
         logger.error("Error reading %s: %s", version_file, e)
         return "1.0.0"
 
-def check_for_application_updates(current_version):
+def fetch_latest_remote_version() -> str:
+    """
+    Fetch the latest published version number, reusing a recently fetched value.
+
+    Returns:
+        str: The latest version number.
+    """
+    version = _remote_version_cache.get_fresh(VERSION_CACHE_DURATION)
+    if version is not None:
+        return version
+
+    # Revalidate with the stored validators so an unchanged file costs only a 304 exchange
+    etag, last_modified, cached_version = load_version_validators()
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    response = get_session().get(LATEST_VERSION_URL, headers=headers, timeout=CHECK_TIMEOUT)
+    response.raise_for_status()
+    if response.status_code == 304 and cached_version:
+        version = cached_version
+    else:
+        version = response.text.strip()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified):
+            save_version_validators(etag, last_modified, version)
+    _remote_version_cache.set(version)
+    return version
+
+def load_version_validators() -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Load the cache validators of the last downloaded version file and the version it contained.
+
+    Returns:
+        tuple: (etag, last_modified, version), with None for anything not usably stored.
+    """
+    try:
+        with open(VERSION_ETAG_PATH, "r") as f:
+            etag, last_modified, version = f.read().split("\n", 2)
+    except (OSError, ValueError):
+        return None, None, None
+    version = version.strip()
+    if not version:
+        return None, None, None
+    return etag or None, last_modified or None, version
+
+def save_version_validators(etag: Optional[str], last_modified: Optional[str], version: str) -> None:
+    """
+    Store the cache validators of the downloaded version file together with its contents.
+
+    Args:
+        etag (str or None): The ETag returned by the server.
+        last_modified (str or None): The Last-Modified date returned by the server.
+        version (str): The version number the file contained.
+    """
+    try:
+        _write_atomic(VERSION_ETAG_PATH, f"{etag or ''}\n{last_modified or ''}\n{version}".encode("utf-8"))
+    except OSError as e:
+        logger.error("Error writing %s: %s", VERSION_ETAG_PATH, e)
+
+@functools.lru_cache(maxsize=8)
+def parse_version(version: str) -> Version:
+    """Parse a version string, caching the result so repeated checks don't reparse it."""
+    return Version(version)
+
+def check_for_application_updates(current_version: str) -> bool:
     """
     Check for application updates by comparing the current version with the latest version.
 
@@ -230,13 +607,14 @@ def check_for_application_updates(current_version):
     """
     # Fetch the latest version number from the repository
     try:
-        url = "https://raw.githubusercontent.com/rob1010/Hotkey-Helper/main/latest_version.txt"
-        response = requests.get(url)
-        latest_version = response.text.strip()
-        if latest_version > current_version:
-            print(f"New version available: {latest_version}\n and current version: {current_version}")
+        latest_version = fetch_latest_remote_version()
+        if parse_version(latest_version) > parse_version(current_version):
+            logger.info("New version available: %s (current version: %s)", latest_version, current_version)
             return True
         return False
-    except Exception:
-        logger.error("Couldn't check for updates.")
+    except requests.exceptions.RequestException as e:
+        logger.error("Couldn't check for updates: %s", e)
+        return False
+    except InvalidVersion as e:
+        logger.error("Couldn't compare application versions: %s", e)
         return False